@@ -22,20 +22,31 @@ const server = new mcp_js_1.McpServer({
     name: "PowerPoint MCP Server",
     version: "1.0.0"
 });
+// Text box placement shared by every generated slide. pptxgenjs mutates the
+// options object it is given, so callers spread a fresh copy per addText call.
+const TITLE_TEXT_OPTIONS = Object.freeze({ x: 0.5, y: 0.5, fontSize: 24 });
+const BODY_TEXT_OPTIONS = Object.freeze({ x: 0.5, y: 1.5, fontSize: 18 });
+// Shared tool responses
+function textResult(text) {
+    return {
+        content: [{ type: "text", text }]
+    };
+}
+function errorResult(err) {
+    return {
+        content: [{ type: "text", text: `Error: ${err.message}` }],
+        isError: true
+    };
+}
 // Tool: create new .pptx file
 server.tool("create_pptx", { path: zod_1.z.string() }, (_a) => __awaiter(void 0, [_a], void 0, function* ({ path }) {
     try {
         const pptx = new pptxgenjs_1.default();
         yield pptx.writeFile({ fileName: path });
-        return {
-            content: [{ type: "text", text: `Created PowerPoint file at ${path}` }]
-        };
+        return textResult(`Created PowerPoint file at ${path}`);
     }
     catch (err) {
-        return {
-            content: [{ type: "text", text: `Error: ${err.message}` }],
-            isError: true
-        };
+        return errorResult(err);
     }
 }));
 // Tool: add slide
@@ -47,18 +58,13 @@ server.tool("add_slide", {
     try {
         const pptx = new pptxgenjs_1.default();
         const slide = pptx.addSlide();
-        slide.addText(title, { x: 0.5, y: 0.5, fontSize: 24 });
-        slide.addText(content, { x: 0.5, y: 1.5, fontSize: 18 });
+        slide.addText(title, Object.assign({}, TITLE_TEXT_OPTIONS));
+        slide.addText(content, Object.assign({}, BODY_TEXT_OPTIONS));
         yield pptx.writeFile({ fileName: path });
-        return {
-            content: [{ type: "text", text: `Added slide to ${path}` }]
-        };
+        return textResult(`Added slide to ${path}`);
     }
     catch (err) {
-        return {
-            content: [{ type: "text", text: `Error: ${err.message}` }],
-            isError: true
-        };
+        return errorResult(err);
     }
 }));
 // Resource: PowerPoint file existence check and placeholder overview
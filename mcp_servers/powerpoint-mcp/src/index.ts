@@ -10,6 +10,25 @@ const server = new McpServer({
   version: "1.0.0"
 });
 
+// Text box placement shared by every generated slide. pptxgenjs mutates the
+// options object it is given, so callers spread a fresh copy per addText call.
+const TITLE_TEXT_OPTIONS = Object.freeze({ x: 0.5, y: 0.5, fontSize: 24 });
+const BODY_TEXT_OPTIONS = Object.freeze({ x: 0.5, y: 1.5, fontSize: 18 });
+
+// Shared tool responses
+function textResult(text: string) {
+  return {
+    content: [{ type: "text" as const, text }]
+  };
+}
+
+function errorResult(err: unknown) {
+  return {
+    content: [{ type: "text" as const, text: `Error: ${(err as Error).message}` }],
+    isError: true
+  };
+}
+
 // Tool: create new .pptx file
 server.tool(
   "create_pptx",
@@ -18,14 +37,9 @@ server.tool(
     try {
       const pptx = new PptxGenJS();
       await pptx.writeFile({ fileName: path });
-      return {
-        content: [{ type: "text", text: `Created PowerPoint file at ${path}` }]
-      };
+      return textResult(`Created PowerPoint file at ${path}`);
     } catch (err) {
-      return {
-        content: [{ type: "text", text: `Error: ${(err as Error).message}` }],
-        isError: true
-      };
+      return errorResult(err);
     }
   }
 );
@@ -42,17 +56,12 @@ server.tool(
     try {
       const pptx = new PptxGenJS();
       const slide = pptx.addSlide();
-      slide.addText(title, { x: 0.5, y: 0.5, fontSize: 24 });
-      slide.addText(content, { x: 0.5, y: 1.5, fontSize: 18 });
+      slide.addText(title, { ...TITLE_TEXT_OPTIONS });
+      slide.addText(content, { ...BODY_TEXT_OPTIONS });
       await pptx.writeFile({ fileName: path });
-      return {
-        content: [{ type: "text", text: `Added slide to ${path}` }]
-      };
+      return textResult(`Added slide to ${path}`);
     } catch (err) {
-      return {
-        content: [{ type: "text", text: `Error: ${(err as Error).message}` }],
-        isError: true
-      };
+      return errorResult(err);
     }
   }
 );